@@ -114,6 +114,7 @@ class RTLowLevelClient:
         key_credential: Optional[AzureKeyCredential] = None,
         model: Optional[str] = None,
         azure_deployment: Optional[str] = None,
+        binary_frames: bool = False,
     ):
         self._is_azure_openai = url is not None
         if self._is_azure_openai:
@@ -133,6 +134,7 @@ class RTLowLevelClient:
         self._session = ClientSession(base_url=self._url)
         self._model = model
         self._azure_deployment = azure_deployment
+        self._binary_frames = binary_frames
         self.request_id: Optional[uuid.UUID] = None
 
     def _user_agent(self):
@@ -171,17 +173,31 @@ class RTLowLevelClient:
         message_json = message.model_dump_json(exclude_unset=True)
         await self.ws.send_str(message_json)
 
-    async def recv(self) -> ServerMessageType | None:
+    async def send_binary(self, data: bytes):
+        """Send raw bytes as a binary websocket frame, bypassing JSON and base64.
+
+        Only useful against endpoints that accept binary audio frames; the
+        standard protocol carries audio base64-encoded inside JSON messages.
+        """
+        await self.ws.send_bytes(data)
+
+    async def recv(self) -> ServerMessageType | bytes | None:
         if self.ws.closed:
             return None
         websocket_message = await self.ws.receive()
         if websocket_message.type == WSMsgType.TEXT:
             data = json.loads(websocket_message.data)
             return create_message_from_dict(data)
+        elif websocket_message.type == WSMsgType.BINARY and self._binary_frames:
+            # Raw payload (e.g. PCM audio) from servers that negotiate the
+            # binary fast path; returned as-is for the caller to route. Only
+            # surfaced when the client opted in, so consumers that expect
+            # model messages (e.g. RTClient) never see raw bytes.
+            return websocket_message.data
         else:
             return None
 
-    def __aiter__(self) -> AsyncIterator[ServerMessageType | None]:
+    def __aiter__(self) -> AsyncIterator[ServerMessageType | bytes | None]:
         return self
 
     async def __anext__(self):
@@ -2,34 +2,65 @@
 # Licensed under the MIT license.
 
 import asyncio
-import base64
+import logging
 import os
 import sys
 import threading
 
+from math import gcd
+
 import numpy as np
+import pybase64
+import sounddevice as sd
 import soundfile as sf
 import pyaudio
 from azure.core.credentials import AzureKeyCredential
 from dotenv import load_dotenv
-from scipy.signal import resample
+from scipy.signal import resample_poly
 from tkinter import Tk, Button
 
 from rtclient import InputAudioTranscription, RTClient, RTInputItem, RTOutputItem, RTResponse, ServerVAD
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, not available on Windows
+    uvloop = None
+
+logger = logging.getLogger("audio")
+
+playback_stream = None
+
+
+def get_playback_stream():
+    global playback_stream
+    if playback_stream is None:
+        playback_stream = sd.RawOutputStream(
+            samplerate=24000, channels=1, dtype="int16", blocksize=2048, latency="low"
+        )
+        playback_stream.start()
+    return playback_stream
+
+
+def close_playback_stream():
+    global playback_stream
+    if playback_stream is not None:
+        playback_stream.stop()
+        playback_stream.close()
+        playback_stream = None
+
 
 def resample_audio(audio_data, original_sample_rate, target_sample_rate):
-    number_of_samples = round(len(audio_data) * float(target_sample_rate) / original_sample_rate)
-    resampled_audio = resample(audio_data, number_of_samples)
-    return resampled_audio.astype(np.int16)
+    g = gcd(original_sample_rate, target_sample_rate)
+    up = target_sample_rate // g
+    down = original_sample_rate // g
+    resampled_audio = resample_poly(audio_data.astype(np.float32, copy=False), up, down)
+    return resampled_audio.astype(np.int16, copy=False)
 
 
 async def send_audio(client: RTClient, audio_file_path: str = None, use_mic: bool = False):
     sample_rate = 16000
     duration_ms = 100
     samples_per_chunk = sample_rate * (duration_ms / 1000)
-    bytes_per_sample = 2
-    bytes_per_chunk = int(samples_per_chunk * bytes_per_sample)
 
     if use_mic:
         p = pyaudio.PyAudio()
@@ -43,7 +74,7 @@ async def send_audio(client: RTClient, audio_file_path: str = None, use_mic: boo
                 await client.generate_response()
                 break
             audio_data = stream.read(int(samples_per_chunk))
-            print(f"Sending audio{audio_data}")
+            logger.debug("chunk %d bytes", len(audio_data))
             await client.send_audio(audio_data)
     else:
         extra_params = (
@@ -56,16 +87,36 @@ async def send_audio(client: RTClient, audio_file_path: str = None, use_mic: boo
             else {}
         )
 
-        audio_data, original_sample_rate = sf.read(audio_file_path, dtype="int16", **extra_params)
-
-        if original_sample_rate != sample_rate:
-            audio_data = resample_audio(audio_data, original_sample_rate, sample_rate)
-
-        audio_bytes = audio_data.tobytes()
-
-        for i in range(0, len(audio_bytes), bytes_per_chunk):
-            chunk = audio_bytes[i : i + bytes_per_chunk]
-            await client.send_audio(chunk)
+        # A bounded queue overlaps file reads and resampling with the
+        # websocket writes while keeping at most a few chunks resident; a
+        # single sender preserves input_audio_buffer.append ordering, which
+        # is protocol-significant.
+        chunks = asyncio.Queue(maxsize=8)
+
+        async def sender():
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                await client.send_audio(chunk)
+
+        sender_task = asyncio.create_task(sender())
+        with sf.SoundFile(audio_file_path, **extra_params) as f:
+            if f.samplerate == sample_rate:
+                # Already at the target rate: stream the file block by block.
+                for block in f.blocks(blocksize=int(samples_per_chunk), dtype="int16", always_2d=False):
+                    await chunks.put(block.tobytes())
+            else:
+                # Polyphase filtering is stateful; resampling block by block
+                # zero-pads every block edge and clicks at each boundary, so
+                # resample the whole file in one pass and chunk the result.
+                audio_data = resample_audio(f.read(dtype="int16", always_2d=False), f.samplerate, sample_rate)
+                audio_bytes = memoryview(audio_data.tobytes())
+                bytes_per_chunk = int(samples_per_chunk) * 2
+                for i in range(0, len(audio_bytes), bytes_per_chunk):
+                    await chunks.put(audio_bytes[i : i + bytes_per_chunk])
+        await chunks.put(None)
+        await sender_task
 
 
 async def receive_control(client: RTClient):
@@ -78,42 +129,40 @@ async def receive_control(client: RTClient):
 
 async def receive_item(item: RTOutputItem, out_dir: str):
     prefix = f"[response={item.response_id}][item={item.id}]"
-    audio_data = None
-    audio_transcript = None
-    text_data = None
-    arguments = None
+    audio_lead_in = []  # small pre-buffer (~200 ms) so the first write does not underrun
+    audio_length = 0
+    transcript_parts = []
+    text_parts = []
+    argument_parts = []
     async for chunk in item:
         if chunk.type == "audio_transcript":
-            audio_transcript = (audio_transcript or "") + chunk.data
+            transcript_parts.append(chunk.data)
         elif chunk.type == "audio":
-            if audio_data is None:
-                audio_data = bytearray()
-            audio_bytes = base64.b64decode(chunk.data)
-            audio_data.extend(audio_bytes)
+            audio_bytes = pybase64.b64decode(chunk.data, validate=False)
+            audio_length += len(audio_bytes)
+            if audio_lead_in is not None:
+                audio_lead_in.append(audio_bytes)
+                if len(audio_lead_in) < 2:
+                    continue
+                audio_bytes = b"".join(audio_lead_in)
+                audio_lead_in = None
+            get_playback_stream().write(audio_bytes)
         elif chunk.type == "tool_call_arguments":
-            arguments = (arguments or "") + chunk.data
+            argument_parts.append(chunk.data)
         elif chunk.type == "text":
-            text_data = (text_data or "") + chunk.data
+            text_parts.append(chunk.data)
+    audio_transcript = "".join(transcript_parts) if transcript_parts else None
+    text_data = "".join(text_parts) if text_parts else None
+    arguments = "".join(argument_parts) if argument_parts else None
     if text_data is not None:
         print(prefix, f"Text: {text_data}")
         with open(os.path.join(out_dir, f"{item.id}.text.txt"), "w", encoding="utf-8") as out:
             out.write(text_data)
-    if audio_data is not None:
-        print(prefix, f"Audio received with length: {len(audio_data)}")
-        
-        # Play the received audio
-        p = pyaudio.PyAudio()
-        stream = p.open(format=pyaudio.paInt16,
-                        channels=1,
-                        rate=24000,
-                        output=True)
-        
-        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-        stream.write(audio_array.tobytes())
-        
-        stream.stop_stream()
-        stream.close()
-        p.terminate()
+    if audio_lead_in:
+        # Stream ended before the pre-buffer filled; play what we have.
+        get_playback_stream().write(b"".join(audio_lead_in))
+    if audio_length:
+        print(prefix, f"Audio received with length: {audio_length}")
 
     if audio_transcript is not None:
         print(prefix, f"Audio Transcript: {audio_transcript}")
@@ -127,9 +176,10 @@ async def receive_item(item: RTOutputItem, out_dir: str):
 
 async def receive_response(client: RTClient, response: RTResponse, out_dir: str):
     prefix = f"[response={response.id}]"
-    async for item in response:
-        print(prefix, f"Received item {item.id}")
-        asyncio.create_task(receive_item(item, out_dir))
+    async with asyncio.TaskGroup() as tg:
+        async for item in response:
+            print(prefix, f"Received item {item.id}")
+            tg.create_task(receive_item(item, out_dir))
     print(prefix, "Response completed")
     await client.close()
 
@@ -144,11 +194,29 @@ async def receive_input_item(item: RTInputItem):
 
 
 async def receive_items(client: RTClient, out_dir: str):
-    async for item in client.items():
-        if isinstance(item, RTResponse):
-            asyncio.create_task(receive_response(client, item, out_dir))
-        else:
-            asyncio.create_task(receive_input_item(item))
+    # A bounded queue applies backpressure so a long session cannot grow the
+    # task set without limit, and the TaskGroup guarantees the workers are
+    # cancelled and awaited if the websocket drops mid-response.
+    items = asyncio.Queue(maxsize=16)
+
+    async def worker():
+        while True:
+            item = await items.get()
+            try:
+                if isinstance(item, RTResponse):
+                    await receive_response(client, item, out_dir)
+                else:
+                    await receive_input_item(item)
+            finally:
+                items.task_done()
+
+    async with asyncio.TaskGroup() as tg:
+        workers = [tg.create_task(worker()) for _ in range(4)]
+        async for item in client.items():
+            await items.put(item)
+        await items.join()
+        for w in workers:
+            w.cancel()
 
 
 async def receive_messages(client: RTClient, out_dir: str):
@@ -175,11 +243,24 @@ def get_env_var(var_name: str) -> str:
     return value
 
 
+azure_config = None
+
+
+def get_azure_config():
+    # Read the environment and build the credential once; every recording
+    # toggle starts a new session and should not repeat this work.
+    global azure_config
+    if azure_config is None:
+        endpoint = get_env_var("AZURE_OPENAI_ENDPOINT")
+        key = get_env_var("AZURE_OPENAI_API_KEY")
+        deployment = get_env_var("AZURE_OPENAI_DEPLOYMENT")
+        azure_config = (endpoint, AzureKeyCredential(key), deployment)
+    return azure_config
+
+
 async def with_azure_openai(audio_file_path: str, out_dir: str, use_mic: bool = False):
-    endpoint = get_env_var("AZURE_OPENAI_ENDPOINT")
-    key = get_env_var("AZURE_OPENAI_API_KEY")
-    deployment = get_env_var("AZURE_OPENAI_DEPLOYMENT")
-    async with RTClient(url=endpoint, key_credential=AzureKeyCredential(key), azure_deployment=deployment) as client:
+    endpoint, credential, deployment = get_azure_config()
+    async with RTClient(url=endpoint, key_credential=credential, azure_deployment=deployment) as client:
         await run(client, out_dir, audio_file_path, use_mic)
 
 
@@ -193,6 +274,8 @@ def start_recording():
     global recording
     recording = True
     print("Recording started...")
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(with_azure_openai(file_path, out_dir, use_mic))
 
 
@@ -232,3 +315,4 @@ if __name__ == "__main__":
     stop_button.pack()
 
     root.mainloop()
+    close_playback_stream()
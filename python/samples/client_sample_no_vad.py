@@ -6,20 +6,24 @@ import base64
 import os
 import sys
 
+from math import gcd
+
 import numpy as np
 import soundfile as sf
 from azure.core.credentials import AzureKeyCredential
 from dotenv import load_dotenv
-from scipy.signal import resample
+from scipy.signal import resample_poly
 
 from rtclient import InputAudioTranscription, RTClient, RTInputItem, RTOutputItem, RTResponse
 from rtclient.models import NoTurnDetection
 
 
 def resample_audio(audio_data, original_sample_rate, target_sample_rate):
-    number_of_samples = round(len(audio_data) * float(target_sample_rate) / original_sample_rate)
-    resampled_audio = resample(audio_data, number_of_samples)
-    return resampled_audio.astype(np.int16)
+    g = gcd(original_sample_rate, target_sample_rate)
+    up = target_sample_rate // g
+    down = original_sample_rate // g
+    resampled_audio = resample_poly(audio_data.astype(np.float32, copy=False), up, down)
+    return resampled_audio.astype(np.int16, copy=False)
 
 
 async def send_audio(client: RTClient, audio_file_path: str):
@@ -44,7 +48,7 @@ async def send_audio(client: RTClient, audio_file_path: str):
     if original_sample_rate != sample_rate:
         audio_data = resample_audio(audio_data, original_sample_rate, sample_rate)
 
-    audio_bytes = audio_data.tobytes()
+    audio_bytes = memoryview(audio_data.tobytes())
 
     for i in range(0, len(audio_bytes), bytes_per_chunk):
         chunk = audio_bytes[i : i + bytes_per_chunk]
@@ -65,21 +69,24 @@ async def receive_control(client: RTClient):
 async def receive_item(item: RTOutputItem, out_dir: str):
     prefix = f"[response={item.response_id}][item={item.id}]"
     audio_data = None
-    audio_transcript = None
-    text_data = None
-    arguments = None
+    transcript_parts = []
+    text_parts = []
+    argument_parts = []
     async for chunk in item:
         if chunk.type == "audio_transcript":
-            audio_transcript = (audio_transcript or "") + chunk.data
+            transcript_parts.append(chunk.data)
         elif chunk.type == "audio":
             if audio_data is None:
                 audio_data = bytearray()
             audio_bytes = base64.b64decode(chunk.data)
             audio_data.extend(audio_bytes)
         elif chunk.type == "tool_call_arguments":
-            arguments = (arguments or "") + chunk.data
+            argument_parts.append(chunk.data)
         elif chunk.type == "text":
-            text_data = (text_data or "") + chunk.data
+            text_parts.append(chunk.data)
+    audio_transcript = "".join(transcript_parts) if transcript_parts else None
+    text_data = "".join(text_parts) if text_parts else None
+    arguments = "".join(argument_parts) if argument_parts else None
     if text_data is not None:
         print(prefix, f"Text: {text_data}")
         with open(os.path.join(out_dir, f"{item.id}.text.txt"), "w", encoding="utf-8") as out:
@@ -3,7 +3,6 @@
 # Licensed under the MIT license.
 
 import asyncio
-import base64
 import os
 import sys
 
@@ -12,7 +11,7 @@ import soundfile as sf
 from azure.core.credentials import AzureKeyCredential
 from dotenv import load_dotenv
 from scipy.signal import resample
-import pyaudio
+import queue
 import wave
 import tkinter as tk
 import threading
@@ -27,6 +26,16 @@ from rtclient import (
     SessionUpdateParams,
 )
 
+try:
+    import pybase64 as base64  # SIMD base64; same API as the stdlib module
+except ImportError:  # pragma: no cover - optional accelerator
+    import base64
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, not available on Windows
+    uvloop = None
+
 
 
 
@@ -37,35 +46,58 @@ def get_env_var(var_name: str) -> str:
     return value
 
 
+azure_config = None
+
+
+def get_azure_config():
+    # Read the environment and build the credential once; each recording
+    # starts a new session and should not repeat this work.
+    global azure_config
+    if azure_config is None:
+        endpoint = get_env_var("AZURE_OPENAI_ENDPOINT")
+        key = get_env_var("AZURE_OPENAI_API_KEY")
+        deployment = get_env_var("AZURE_OPENAI_DEPLOYMENT")
+        azure_config = (endpoint, AzureKeyCredential(key), deployment)
+    return azure_config
+
+
 
 class AudioRecorder:
     def __init__(self):
         self.is_recording = False
-        self.frames = []
+        self.buffer = bytearray()
         self.sample_rate = 24000
-        self.chunk = 1024
-        self.audio = pyaudio.PyAudio()
+        self.chunk = 4800  # 100 ms at 24 kHz, matching the send chunk size
+        self.queue = queue.SimpleQueue()
         self.stream = None
 
+    def _on_audio(self, indata, frames, time, status):
+        # Runs on PortAudio's real-time thread; keep it to a single enqueue.
+        self.queue.put_nowait(bytes(indata))
+
     def start_recording(self):
         self.is_recording = True
-        self.frames = []
-        self.stream = self.audio.open(format=pyaudio.paInt16,
-                                      channels=1,
-                                      rate=self.sample_rate,
-                                      input=True,
-                                      frames_per_buffer=self.chunk)
+        self.buffer = bytearray()
+        self.stream = sd.RawInputStream(samplerate=self.sample_rate,
+                                        channels=1,
+                                        dtype='int16',
+                                        blocksize=self.chunk,
+                                        callback=self._on_audio)
+        self.stream.start()
         print("Recording started...")
 
     def stop_recording(self):
         if self.stream:
-            self.stream.stop_stream()
+            self.stream.stop()
             self.stream.close()
         self.is_recording = False
         print("Recording stopped.")
 
     def get_audio_data(self):
-        return b''.join(self.frames)
+        # Immutable snapshot: a view over the live bytearray would block
+        # further extend() calls (BufferError on resize) and race the drain
+        # thread. Slices of the view are still zero-copy.
+        return memoryview(bytes(self.buffer))
 
 class Application(tk.Tk):
     def __init__(self):
@@ -76,29 +108,48 @@ class Application(tk.Tk):
         self.button.pack(pady=20)
         self.loop = asyncio.new_event_loop()
         self.api_thread = None
+        self.record_thread = None
         self.status_label = tk.Label(self, text="")
         self.status_label.pack(pady=10)
+        # One output stream for the whole session; opening a PortAudio
+        # stream per response costs ~50-200 ms each time.
+        self.play_stream = sd.OutputStream(samplerate=24000, channels=1, dtype='int16',
+                                           blocksize=2048, latency='low')
+        self.play_stream.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def toggle_recording(self):
         if not self.recorder.is_recording:
             self.recorder.start_recording()
             self.button.config(text="Stop Recording")
-            threading.Thread(target=self.record_audio).start()
+            self.record_thread = threading.Thread(target=self.record_audio)
+            self.record_thread.start()
         else:
             self.recorder.stop_recording()
             self.button.config(text="Start Recording")
             self.process_audio()
 
     def record_audio(self):
+        # Drain frames handed off by the PortAudio callback; no Python code
+        # runs on the audio thread itself.
         try:
             while self.recorder.is_recording:
-                data = self.recorder.stream.read(self.recorder.chunk)
-                self.recorder.frames.append(data)
+                try:
+                    data = self.recorder.queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                self.recorder.buffer.extend(data)
+            while not self.recorder.queue.empty():
+                self.recorder.buffer.extend(self.recorder.queue.get_nowait())
         except Exception as e:
             self.show_status(f"Error during recording: {str(e)}")
 
     def process_audio(self):
         try:
+            # Wait for the drain thread to flush the last queued chunks so
+            # the snapshot includes the recording tail.
+            if self.record_thread is not None:
+                self.record_thread.join()
             audio_data = self.recorder.get_audio_data()
             if self.api_thread and self.api_thread.is_alive():
                 self.loop.call_soon_threadsafe(self.loop.stop)
@@ -117,12 +168,10 @@ class Application(tk.Tk):
 
     async def send_audio_to_api(self, audio_data):
         try:
-            endpoint = get_env_var("AZURE_OPENAI_ENDPOINT")
-            key = get_env_var("AZURE_OPENAI_API_KEY")
-            deployment = get_env_var("AZURE_OPENAI_DEPLOYMENT")
+            endpoint, credential, deployment = get_azure_config()
 
             async with RTLowLevelClient(
-                endpoint, key_credential=AzureKeyCredential(key), azure_deployment=deployment
+                endpoint, key_credential=credential, azure_deployment=deployment
             ) as client:
                 await client.send(
                     SessionUpdateMessage(
@@ -140,12 +189,12 @@ class Application(tk.Tk):
         except Exception as e:
             self.show_status(f"Error in API communication: {str(e)}")
 
-    async def send_audio(self, client: RTLowLevelClient, audio_data: bytes):
+    async def send_audio(self, client: RTLowLevelClient, audio_data: memoryview):
         try:
             chunk_size = 4800  # 100ms at 24000 Hz, 2 bytes per sample
             for i in range(0, len(audio_data), chunk_size):
                 chunk = audio_data[i:i + chunk_size]
-                base64_audio = base64.b64encode(chunk).decode("utf-8")
+                base64_audio = base64.b64encode(chunk).decode("ascii")
                 await client.send(InputAudioBufferAppendMessage(audio=base64_audio))
             # Send end of stream message
             # await client.send(InputAudioBufferAppendMessage(audio=None))
@@ -154,17 +203,17 @@ class Application(tk.Tk):
 
     async def receive_and_play_response(self, client: RTLowLevelClient):
         try:
-            audio_buffer = []
             while not client.closed:
                 message = await client.recv()
                 if message is None:
                     continue
                 if message.type == "response.audio.delta":
-                    audio_buffer.append(base64.b64decode(message.delta))
+                    # Write each delta into the persistent stream as it
+                    # arrives; stream.write blocks in PortAudio C code with
+                    # the GIL released, so playback starts on the first
+                    # delta instead of after the full response.
+                    self.play_audio(base64.b64decode(message.delta))
                 elif message.type == "response.done":
-                    if audio_buffer:
-                        audio_data = b''.join(audio_buffer)
-                        self.after(0, self.play_audio, audio_data)
                     break
                 elif message.type == "response.text.delta":
                     self.show_status(f"Received text: {message.delta}")
@@ -173,18 +222,28 @@ class Application(tk.Tk):
 
     def play_audio(self, audio_data):
         try:
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            sd.play(audio_array, samplerate=24000)
-            sd.wait()
+            # Reinterpret the decoded bytes as int16 in place; stream.write
+            # copies into PortAudio's ring buffer, so no scratch copy of our
+            # own is needed.
+            self.play_stream.write(np.frombuffer(audio_data, dtype=np.int16).reshape(-1, 1))
         except Exception as e:
             self.show_status(f"Error playing audio: {str(e)}")
 
+    def on_close(self):
+        try:
+            self.play_stream.stop()
+            self.play_stream.close()
+        finally:
+            self.destroy()
+
     def show_status(self, message):
         print(message)  # Print to console for debugging
         self.status_label.config(text=message)
 
 if __name__ == "__main__":
     load_dotenv()
+    if uvloop is not None:
+        uvloop.install()
     try:
         app = Application()
         app.mainloop()
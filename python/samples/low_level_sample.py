@@ -6,11 +6,13 @@ import base64
 import os
 import sys
 
+from math import gcd
+
 import numpy as np
 import soundfile as sf
 from azure.core.credentials import AzureKeyCredential
 from dotenv import load_dotenv
-from scipy.signal import resample
+from scipy.signal import resample_poly
 
 from rtclient import (
     InputAudioBufferAppendMessage,
@@ -23,9 +25,11 @@ from rtclient import (
 
 
 def resample_audio(audio_data, original_sample_rate, target_sample_rate):
-    number_of_samples = round(len(audio_data) * float(target_sample_rate) / original_sample_rate)
-    resampled_audio = resample(audio_data, number_of_samples)
-    return resampled_audio.astype(np.int16)
+    g = gcd(original_sample_rate, target_sample_rate)
+    up = target_sample_rate // g
+    down = original_sample_rate // g
+    resampled_audio = resample_poly(audio_data.astype(np.float32, copy=False), up, down)
+    return resampled_audio.astype(np.int16, copy=False)
 
 
 async def send_audio(client: RTLowLevelClient, audio_file_path: str):
@@ -50,7 +54,7 @@ async def send_audio(client: RTLowLevelClient, audio_file_path: str):
     if original_sample_rate != sample_rate:
         audio_data = resample_audio(audio_data, original_sample_rate, sample_rate)
 
-    audio_bytes = audio_data.tobytes()
+    audio_bytes = memoryview(audio_data.tobytes())
 
     for i in range(0, len(audio_bytes), bytes_per_chunk):
         chunk = audio_bytes[i : i + bytes_per_chunk]
@@ -58,168 +62,244 @@ async def send_audio(client: RTLowLevelClient, audio_file_path: str):
         await client.send(InputAudioBufferAppendMessage(audio=base64_audio))
 
 
+# Prints for high-rate delta messages are gated behind VERBOSE so the hot
+# receive loop skips f-string formatting unless explicitly requested.
+VERBOSE = os.environ.get("RTCLIENT_VERBOSE", "").lower() in ("1", "true", "yes")
+
+
+def _on_session_created(message):
+    print("Session Created Message")
+    print(f"  Model: {message.session.model}")
+    print(f"  Session Id: {message.session.id}")
+
+
+def _on_error(message):
+    print("Error Message")
+    print(f"  Error: {message.error}")
+
+
+def _on_input_audio_buffer_committed(message):
+    print("Input Audio Buffer Committed Message")
+    print(f"  Item Id: {message.item_id}")
+
+
+def _on_input_audio_buffer_cleared(message):
+    print("Input Audio Buffer Cleared Message")
+
+
+def _on_input_audio_buffer_speech_started(message):
+    print("Input Audio Buffer Speech Started Message")
+    print(f"  Item Id: {message.item_id}")
+    print(f"  Audio Start [ms]: {message.audio_start_ms}")
+
+
+def _on_input_audio_buffer_speech_stopped(message):
+    print("Input Audio Buffer Speech Stopped Message")
+    print(f"  Item Id: {message.item_id}")
+    print(f"  Audio End [ms]: {message.audio_end_ms}")
+
+
+def _on_conversation_item_created(message):
+    print("Conversation Item Created Message")
+    print(f"  Id: {message.item.id}")
+    print(f"  Previous Id: {message.previous_item_id}")
+    if message.item.type == "message":
+        print(f"  Role: {message.item.role}")
+        for index, content in enumerate(message.item.content):
+            print(f"  [{index}]:")
+            print(f"    Content Type: {content.type}")
+            if content.type == "input_text" or content.type == "text":
+                print(f"  Text: {content.text}")
+            elif content.type == "input_audio" or content.type == "audio":
+                print(f"  Audio Transcript: {content.transcript}")
+
+
+def _on_conversation_item_truncated(message):
+    print("Conversation Item Truncated Message")
+    print(f"  Id: {message.item_id}")
+    print(f" Content Index: {message.content_index}")
+    print(f"  Audio End [ms]: {message.audio_end_ms}")
+
+
+def _on_conversation_item_deleted(message):
+    print("Conversation Item Deleted Message")
+    print(f"  Id: {message.item_id}")
+
+
+def _on_input_audio_transcription_completed(message):
+    print("Input Audio Transcription Completed Message")
+    print(f"  Id: {message.item_id}")
+    print(f"  Content Index: {message.content_index}")
+    print(f"  Transcript: {message.transcript}")
+
+
+def _on_input_audio_transcription_failed(message):
+    print("Input Audio Transcription Failed Message")
+    print(f"  Id: {message.item_id}")
+    print(f"  Error: {message.error}")
+
+
+def _on_response_created(message):
+    print("Response Created Message")
+    print(f"  Response Id: {message.response.id}")
+    print("  Output Items:")
+    for index, item in enumerate(message.response.output):
+        print(f"  [{index}]:")
+        print(f"    Item Id: {item.id}")
+        print(f"    Type: {item.type}")
+        if item.type == "message":
+            print(f"    Role: {item.role}")
+            for content_index, content in enumerate(item.content):
+                print(f"    [{content_index}]:")
+                print(f"      Content Type: {content.type}")
+                if item.role == "user" and content.type == "input_audio":
+                    print(f"      Audio Data Length: {len(content.audio)}")
+                else:
+                    print(f"      Text: {content.text}")
+        elif item.type == "function_call":
+            print(f"    Call Id: {item.call_id}")
+            print(f"    Function Name: {item.name}")
+            print(f"    Parameters: {item.arguments}")
+        elif item.type == "function_call_output":
+            print(f"    Call Id: {item.call_id}")
+            print(f"    Output: {item.output}")
+
+
+def _on_response_done(message):
+    print("Response Done Message")
+    print(f"  Response Id: {message.response.id}")
+    if message.response.status_details:
+        print(f"  Status Details: {message.response.status_details.model_dump_json()}")
+    return True
+
+
+def _on_response_output_item_added(message):
+    print("Response Output Item Added Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Item Id: {message.item.id}")
+
+
+def _on_response_output_item_done(message):
+    print("Response Output Item Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Item Id: {message.item.id}")
+
+
+def _on_response_content_part_added(message):
+    print("Response Content Part Added Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Item Id: {message.item_id}")
+
+
+def _on_response_content_part_done(message):
+    print("Response Content Part Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  ItemPart Id: {message.item_id}")
+
+
+def _on_response_text_delta(message):
+    if VERBOSE:
+        print("Response Text Delta Message")
+        print(f"  Response Id: {message.response_id}")
+        print(f"  Text: {message.delta}")
+
+
+def _on_response_text_done(message):
+    print("Response Text Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Text: {message.text}")
+
+
+def _on_response_audio_transcript_delta(message):
+    if VERBOSE:
+        print("Response Audio Transcript Delta Message")
+        print(f"  Response Id: {message.response_id}")
+        print(f"  Item Id: {message.item_id}")
+        print(f"  Transcript: {message.delta}")
+
+
+def _on_response_audio_transcript_done(message):
+    print("Response Audio Transcript Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Item Id: {message.item_id}")
+    print(f"  Transcript: {message.transcript}")
+
+
+def _on_response_audio_delta(message):
+    if VERBOSE:
+        print("Response Audio Delta Message")
+        print(f"  Response Id: {message.response_id}")
+        print(f"  Item Id: {message.item_id}")
+        print(f"  Audio Data Length: {len(message.delta)}")
+
+
+def _on_response_audio_done(message):
+    print("Response Audio Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Item Id: {message.item_id}")
+
+
+def _on_response_function_call_arguments_delta(message):
+    if VERBOSE:
+        print("Response Function Call Arguments Delta Message")
+        print(f"  Response Id: {message.response_id}")
+        print(f"  Arguments: {message.delta}")
+
+
+def _on_response_function_call_arguments_done(message):
+    print("Response Function Call Arguments Done Message")
+    print(f"  Response Id: {message.response_id}")
+    print(f"  Arguments: {message.arguments}")
+
+
+def _on_rate_limits_updated(message):
+    print("Rate Limits Updated Message")
+    print(f"  Rate Limits: {message.rate_limits}")
+
+
+def _on_unknown(message):
+    print("Unknown Message")
+
+
+# O(1) dispatch table; a handler returns True to stop the receive loop.
+HANDLERS = {
+    "session.created": _on_session_created,
+    "error": _on_error,
+    "input_audio_buffer.committed": _on_input_audio_buffer_committed,
+    "input_audio_buffer.cleared": _on_input_audio_buffer_cleared,
+    "input_audio_buffer.speech_started": _on_input_audio_buffer_speech_started,
+    "input_audio_buffer.speech_stopped": _on_input_audio_buffer_speech_stopped,
+    "conversation.item.created": _on_conversation_item_created,
+    "conversation.item.truncated": _on_conversation_item_truncated,
+    "conversation.item.deleted": _on_conversation_item_deleted,
+    "conversation.item.input_audio_transcription.completed": _on_input_audio_transcription_completed,
+    "conversation.item.input_audio_transcription.failed": _on_input_audio_transcription_failed,
+    "response.created": _on_response_created,
+    "response.done": _on_response_done,
+    "response.output_item.added": _on_response_output_item_added,
+    "response.output_item.done": _on_response_output_item_done,
+    "response.content_part.added": _on_response_content_part_added,
+    "response.content_part.done": _on_response_content_part_done,
+    "response.text.delta": _on_response_text_delta,
+    "response.text.done": _on_response_text_done,
+    "response.audio_transcript.delta": _on_response_audio_transcript_delta,
+    "response.audio_transcript.done": _on_response_audio_transcript_done,
+    "response.audio.delta": _on_response_audio_delta,
+    "response.audio.done": _on_response_audio_done,
+    "response.function_call_arguments.delta": _on_response_function_call_arguments_delta,
+    "response.function_call_arguments.done": _on_response_function_call_arguments_done,
+    "rate_limits.updated": _on_rate_limits_updated,
+}
+
+
 async def receive_messages(client: RTLowLevelClient):
     while not client.closed:
         message = await client.recv()
         if message is None:
             continue
-        match message.type:
-            case "session.created":
-                print("Session Created Message")
-                print(f"  Model: {message.session.model}")
-                print(f"  Session Id: {message.session.id}")
-                pass
-            case "error":
-                print("Error Message")
-                print(f"  Error: {message.error}")
-                pass
-            case "input_audio_buffer.committed":
-                print("Input Audio Buffer Committed Message")
-                print(f"  Item Id: {message.item_id}")
-                pass
-            case "input_audio_buffer.cleared":
-                print("Input Audio Buffer Cleared Message")
-                pass
-            case "input_audio_buffer.speech_started":
-                print("Input Audio Buffer Speech Started Message")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio Start [ms]: {message.audio_start_ms}")
-                pass
-            case "input_audio_buffer.speech_stopped":
-                print("Input Audio Buffer Speech Stopped Message")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio End [ms]: {message.audio_end_ms}")
-                pass
-            case "conversation.item.created":
-                print("Conversation Item Created Message")
-                print(f"  Id: {message.item.id}")
-                print(f"  Previous Id: {message.previous_item_id}")
-                if message.item.type == "message":
-                    print(f"  Role: {message.item.role}")
-                    for index, content in enumerate(message.item.content):
-                        print(f"  [{index}]:")
-                        print(f"    Content Type: {content.type}")
-                        if content.type == "input_text" or content.type == "text":
-                            print(f"  Text: {content.text}")
-                        elif content.type == "input_audio" or content.type == "audio":
-                            print(f"  Audio Transcript: {content.transcript}")
-                pass
-            case "conversation.item.truncated":
-                print("Conversation Item Truncated Message")
-                print(f"  Id: {message.item_id}")
-                print(f" Content Index: {message.content_index}")
-                print(f"  Audio End [ms]: {message.audio_end_ms}")
-            case "conversation.item.deleted":
-                print("Conversation Item Deleted Message")
-                print(f"  Id: {message.item_id}")
-            case "conversation.item.input_audio_transcription.completed":
-                print("Input Audio Transcription Completed Message")
-                print(f"  Id: {message.item_id}")
-                print(f"  Content Index: {message.content_index}")
-                print(f"  Transcript: {message.transcript}")
-            case "conversation.item.input_audio_transcription.failed":
-                print("Input Audio Transcription Failed Message")
-                print(f"  Id: {message.item_id}")
-                print(f"  Error: {message.error}")
-            case "response.created":
-                print("Response Created Message")
-                print(f"  Response Id: {message.response.id}")
-                print("  Output Items:")
-                for index, item in enumerate(message.response.output):
-                    print(f"  [{index}]:")
-                    print(f"    Item Id: {item.id}")
-                    print(f"    Type: {item.type}")
-                    if item.type == "message":
-                        print(f"    Role: {item.role}")
-                        match item.role:
-                            case "system":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    print(f"      Text: {content.text}")
-                            case "user":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    if content.type == "input_text":
-                                        print(f"      Text: {content.text}")
-                                    elif content.type == "input_audio":
-                                        print(f"      Audio Data Length: {len(content.audio)}")
-                            case "assistant":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    print(f"      Text: {content.text}")
-                    elif item.type == "function_call":
-                        print(f"    Call Id: {item.call_id}")
-                        print(f"    Function Name: {item.name}")
-                        print(f"    Parameters: {item.arguments}")
-                    elif item.type == "function_call_output":
-                        print(f"    Call Id: {item.call_id}")
-                        print(f"    Output: {item.output}")
-            case "response.done":
-                print("Response Done Message")
-                print(f"  Response Id: {message.response.id}")
-                if message.response.status_details:
-                    print(f"  Status Details: {message.response.status_details.model_dump_json()}")
-                break
-            case "response.output_item.added":
-                print("Response Output Item Added Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item.id}")
-            case "response.output_item.done":
-                print("Response Output Item Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item.id}")
-
-            case "response.content_part.added":
-                print("Response Content Part Added Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-            case "response.content_part.done":
-                print("Response Content Part Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  ItemPart Id: {message.item_id}")
-            case "response.text.delta":
-                print("Response Text Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Text: {message.delta}")
-            case "response.text.done":
-                print("Response Text Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Text: {message.text}")
-            case "response.audio_transcript.delta":
-                print("Response Audio Transcript Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Transcript: {message.delta}")
-            case "response.audio_transcript.done":
-                print("Response Audio Transcript Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Transcript: {message.transcript}")
-            case "response.audio.delta":
-                print("Response Audio Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio Data Length: {len(message.delta)}")
-            case "response.audio.done":
-                print("Response Audio Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-            case "response.function_call_arguments.delta":
-                print("Response Function Call Arguments Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Arguments: {message.delta}")
-            case "response.function_call_arguments.done":
-                print("Response Function Call Arguments Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Arguments: {message.arguments}")
-            case "rate_limits.updated":
-                print("Rate Limits Updated Message")
-                print(f"  Rate Limits: {message.rate_limits}")
-            case _:
-                print("Unknown Message")
+        handler = HANDLERS.get(message.type, _on_unknown)
+        if handler(message):
+            break
 
 
 def get_env_var(var_name: str) -> str:
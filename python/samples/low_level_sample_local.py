@@ -2,21 +2,24 @@
 # Licensed under the MIT license.
 
 import asyncio
-import base64
+import atexit
+import concurrent.futures
+import logging
 import os
-import sys
+
+# PulseAudio sizes its stream buffers from this variable and can otherwise
+# pick multi-second defaults; it must be set before PortAudio is loaded.
+# AUDIO_LATENCY_MS lets users trade latency for robustness.
+os.environ.setdefault("PULSE_LATENCY_MSEC", os.environ.get("AUDIO_LATENCY_MS", "50"))
+
 import tkinter as tk
 import pyaudio
 import threading
-import queue
-import io
-import wave
 
-import numpy as np
-import soundfile as sf
+from operator import attrgetter
+
 from azure.core.credentials import AzureKeyCredential
 from dotenv import load_dotenv
-from scipy.signal import resample
 
 from rtclient import (
     InputAudioBufferAppendMessage,
@@ -27,210 +30,279 @@ from rtclient import (
     SessionUpdateParams,
 )
 
+try:
+    import pybase64 as base64  # SIMD base64; same API as the stdlib module
+except ImportError:  # pragma: no cover - optional accelerator
+    import base64
+
+log = logging.getLogger(__name__)
+
+# Opt-in fast path: ship mic audio as raw binary websocket frames and play
+# binary frames straight back, skipping base64 and JSON on both sides
+# (~33% less on the wire). Only valid against servers that accept it.
+BINARY_AUDIO = os.environ.get("RTCLIENT_BINARY_AUDIO", "").lower() in ("1", "true", "yes")
+
+
+_pa = None
+
+
+def get_pa():
+    # PyAudio() re-initializes PortAudio each time; keep one instance alive
+    # for the whole process.
+    global _pa
+    if _pa is None:
+        _pa = pyaudio.PyAudio()
+    return _pa
+
 
+_out_stream = None
+
+
+def get_output_stream():
+    # One persistent playback stream for the process; deltas are written
+    # into it as they arrive so first audio is one block away, not a full
+    # response away.
+    global _out_stream
+    if _out_stream is None:
+        _out_stream = get_pa().open(format=pyaudio.paInt16,
+                                    channels=1,
+                                    rate=24000,
+                                    output=True,
+                                    frames_per_buffer=512)
+    return _out_stream
+
+
+@atexit.register
+def _close_audio():
+    # The stream and PyAudio instance live for the whole process; release
+    # the PortAudio device cleanly on interpreter exit.
+    if _out_stream is not None:
+        _out_stream.close()
+    if _pa is not None:
+        _pa.terminate()
+
+
+def decode_and_play(delta: str):
+    # Both the base64 decode and the blocking stream write run off the event
+    # loop (via asyncio.to_thread) so recv/send keep flowing during playback.
+    get_output_stream().write(base64.b64decode(delta))
+
+
+def play_raw(pcm: bytes):
+    get_output_stream().write(pcm)
+
+
+def _on_error(message):
+    log.error("Error Message")
+    log.error("  Error: %s", message.error)
+
+
+def _on_input_audio_transcription_failed(message):
+    log.debug("Input Audio Transcription Failed Message")
+    log.debug("  Id: %s", message.item_id)
+    log.error("  Error: %s", message.error)
+
+
+def _on_conversation_item_created(message):
+    log.debug("Conversation Item Created Message")
+    log.debug("  Id: %s", message.item.id)
+    log.debug("  Previous Id: %s", message.previous_item_id)
+    if message.item.type == "message":
+        log.debug("  Role: %s", message.item.role)
+        for index, content in enumerate(message.item.content):
+            log.debug("  [%s]:", index)
+            log.debug("    Content Type: %s", content.type)
+            if content.type == "input_text" or content.type == "text":
+                log.debug("  Text: %s", content.text)
+            elif content.type == "input_audio" or content.type == "audio":
+                log.debug("  Audio Transcript: %s", content.transcript)
+
+
+def _on_response_created(message):
+    log.debug("Response Created Message")
+    log.debug("  Response Id: %s", message.response.id)
+    log.debug("  Output Items:")
+    for index, item in enumerate(message.response.output):
+        log.debug("  [%s]:", index)
+        log.debug("    Item Id: %s", item.id)
+        log.debug("    Type: %s", item.type)
+        if item.type == "message":
+            log.debug("    Role: %s", item.role)
+            for content_index, content in enumerate(item.content):
+                log.debug("    [%s]:", content_index)
+                log.debug("      Content Type: %s", content.type)
+                if item.role == "user" and content.type == "input_audio":
+                    log.debug("      Audio Data Length: %s", len(content.audio))
+                else:
+                    log.debug("      Text: %s", content.text)
+        elif item.type == "function_call":
+            log.debug("    Call Id: %s", item.call_id)
+            log.debug("    Function Name: %s", item.name)
+            log.debug("    Parameters: %s", item.arguments)
+        elif item.type == "function_call_output":
+            log.debug("    Call Id: %s", item.call_id)
+            log.debug("    Output: %s", item.output)
+
+
+def _on_response_done(message):
+    log.debug("Response Done Message")
+    log.debug("  Response Id: %s", message.response.id)
+    if message.response.status_details:
+        log.debug("  Status Details: %s", message.response.status_details.model_dump_json())
+
+
+def _on_unknown(message):
+    log.debug("Unknown Message: %s", message.type)
+
+
+# Handlers that need per-message logic (conditionals, loops, error levels).
+HANDLERS = {
+    "error": _on_error,
+    "conversation.item.input_audio_transcription.failed": _on_input_audio_transcription_failed,
+    "conversation.item.created": _on_conversation_item_created,
+    "response.created": _on_response_created,
+    "response.done": _on_response_done,
+}
+
+# Flat log-only message types: one precompiled attrgetter resolves every
+# interesting field in a single C-level lookup and one log.debug call,
+# instead of a handler frame plus N pydantic attribute accesses.
+LOGGED = {
+    "session.created": (
+        "Session Created Message\n  Model: %s\n  Session Id: %s",
+        attrgetter("session.model", "session.id"),
+    ),
+    "input_audio_buffer.committed": (
+        "Input Audio Buffer Committed Message\n  Item Id: %s",
+        attrgetter("item_id"),
+    ),
+    "input_audio_buffer.cleared": (
+        "Input Audio Buffer Cleared Message",
+        None,
+    ),
+    "input_audio_buffer.speech_started": (
+        "Input Audio Buffer Speech Started Message\n  Item Id: %s\n  Audio Start [ms]: %s",
+        attrgetter("item_id", "audio_start_ms"),
+    ),
+    "input_audio_buffer.speech_stopped": (
+        "Input Audio Buffer Speech Stopped Message\n  Item Id: %s\n  Audio End [ms]: %s",
+        attrgetter("item_id", "audio_end_ms"),
+    ),
+    "conversation.item.truncated": (
+        "Conversation Item Truncated Message\n  Id: %s\n Content Index: %s\n  Audio End [ms]: %s",
+        attrgetter("item_id", "content_index", "audio_end_ms"),
+    ),
+    "conversation.item.deleted": (
+        "Conversation Item Deleted Message\n  Id: %s",
+        attrgetter("item_id"),
+    ),
+    "conversation.item.input_audio_transcription.completed": (
+        "Input Audio Transcription Completed Message\n  Id: %s\n  Content Index: %s\n  Transcript: %s",
+        attrgetter("item_id", "content_index", "transcript"),
+    ),
+    "response.output_item.added": (
+        "Response Output Item Added Message\n  Response Id: %s\n  Item Id: %s",
+        attrgetter("response_id", "item.id"),
+    ),
+    "response.output_item.done": (
+        "Response Output Item Done Message\n  Response Id: %s\n  Item Id: %s",
+        attrgetter("response_id", "item.id"),
+    ),
+    "response.content_part.added": (
+        "Response Content Part Added Message\n  Response Id: %s\n  Item Id: %s",
+        attrgetter("response_id", "item_id"),
+    ),
+    "response.content_part.done": (
+        "Response Content Part Done Message\n  Response Id: %s\n  ItemPart Id: %s",
+        attrgetter("response_id", "item_id"),
+    ),
+    "response.text.delta": (
+        "Response Text Delta Message\n  Response Id: %s\n  Text: %s",
+        attrgetter("response_id", "delta"),
+    ),
+    "response.text.done": (
+        "Response Text Done Message\n  Response Id: %s\n  Text: %s",
+        attrgetter("response_id", "text"),
+    ),
+    "response.audio_transcript.delta": (
+        "Response Audio Transcript Delta Message\n  Response Id: %s\n  Item Id: %s\n  Transcript: %s",
+        attrgetter("response_id", "item_id", "delta"),
+    ),
+    "response.audio_transcript.done": (
+        "Response Audio Transcript Done Message\n  Response Id: %s\n  Item Id: %s\n  Transcript: %s",
+        attrgetter("response_id", "item_id", "transcript"),
+    ),
+    "response.audio.done": (
+        "Response Audio Done Message\n  Response Id: %s\n  Item Id: %s",
+        attrgetter("response_id", "item_id"),
+    ),
+    "response.function_call_arguments.delta": (
+        "Response Function Call Arguments Delta Message\n  Response Id: %s\n  Arguments: %s",
+        attrgetter("response_id", "delta"),
+    ),
+    "response.function_call_arguments.done": (
+        "Response Function Call Arguments Done Message\n  Response Id: %s\n  Arguments: %s",
+        attrgetter("response_id", "arguments"),
+    ),
+    "rate_limits.updated": (
+        "Rate Limits Updated Message\n  Rate Limits: %s",
+        attrgetter("rate_limits"),
+    ),
+}
+
+
+# Single worker dedicated to base64 decode + playback writes, so those never
+# run on the event loop and decoding one delta overlaps receiving the next.
+_decode_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-decode")
+
+
+async def _receive_loop(client: RTLowLevelClient, messages: asyncio.Queue):
+    # Producer: nothing but recv + enqueue, so the websocket stays drained
+    # no matter how long a handler takes.
+    while not client.closed:
+        message = await client.recv()
+        if message is None:
+            continue
+        messages.put_nowait(message)
+    messages.put_nowait(None)
 
 
-def play_audio(audio_data):
-    CHUNK = 1024
-    
-    # Create a wave file in memory
-    with io.BytesIO() as wav_buffer:
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)  # Assuming 16-bit audio
-            wav_file.setframerate(24000)  # Assuming 24kHz sample rate
-            wav_file.writeframes(audio_data)
-        
-        wav_buffer.seek(0)
-        
-        # Play the audio
-        p = pyaudio.PyAudio()
-        stream = p.open(format=p.get_format_from_width(2),
-                        channels=1,
-                        rate=24000,
-                        output=True)
-        
-        wav_buffer.seek(44)  # Skip WAV header
-        data = wav_buffer.read(CHUNK)
-        
-        while data:
-            stream.write(data)
-            data = wav_buffer.read(CHUNK)
-        
-        stream.stop_stream()
-        stream.close()
-        p.terminate()
+async def _process_messages(messages: asyncio.Queue):
+    loop = asyncio.get_running_loop()
+    while True:
+        message = await messages.get()
+        if message is None:
+            break
+        if isinstance(message, bytes):
+            # Binary fast path: the frame is raw PCM, play it directly.
+            await loop.run_in_executor(_decode_pool, play_raw, message)
+            continue
+        if message.type == "response.audio.delta":
+            log.debug("Response Audio Delta Message")
+            log.debug("  Audio Data Length: %s", len(message.delta))
+            await loop.run_in_executor(_decode_pool, decode_and_play, message.delta)
+            continue
+        logged = LOGGED.get(message.type)
+        if logged is not None:
+            fmt, getter = logged
+            if getter is None:
+                log.debug(fmt)
+            else:
+                # attrgetter returns a bare value (not a 1-tuple) for a
+                # single path; normalize so the star-unpack stays one arg
+                # per format placeholder.
+                fields = getter(message)
+                if not isinstance(fields, tuple):
+                    fields = (fields,)
+                log.debug(fmt, *fields)
+            continue
+        handler = HANDLERS.get(message.type, _on_unknown)
+        handler(message)
 
 
 async def receive_messages(client: RTLowLevelClient):
-    audio_buffer = b''
-    while not client.closed:
-        message = await client.recv()
-        if message is None:
-            continue
-        match message.type:
-            case "session.created":
-                print("Session Created Message")
-                print(f"  Model: {message.session.model}")
-                print(f"  Session Id: {message.session.id}")
-                pass
-            case "error":
-                print("Error Message")
-                print(f"  Error: {message.error}")
-                pass
-            case "input_audio_buffer.committed":
-                print("Input Audio Buffer Committed Message")
-                print(f"  Item Id: {message.item_id}")
-                pass
-            case "input_audio_buffer.cleared":
-                print("Input Audio Buffer Cleared Message")
-                pass
-            case "input_audio_buffer.speech_started":
-                print("Input Audio Buffer Speech Started Message")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio Start [ms]: {message.audio_start_ms}")
-                pass
-            case "input_audio_buffer.speech_stopped":
-                print("Input Audio Buffer Speech Stopped Message")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio End [ms]: {message.audio_end_ms}")
-                pass
-            case "conversation.item.created":
-                print("Conversation Item Created Message")
-                print(f"  Id: {message.item.id}")
-                print(f"  Previous Id: {message.previous_item_id}")
-                if message.item.type == "message":
-                    print(f"  Role: {message.item.role}")
-                    for index, content in enumerate(message.item.content):
-                        print(f"  [{index}]:")
-                        print(f"    Content Type: {content.type}")
-                        if content.type == "input_text" or content.type == "text":
-                            print(f"  Text: {content.text}")
-                        elif content.type == "input_audio" or content.type == "audio":
-                            print(f"  Audio Transcript: {content.transcript}")
-                pass
-            case "conversation.item.truncated":
-                print("Conversation Item Truncated Message")
-                print(f"  Id: {message.item_id}")
-                print(f" Content Index: {message.content_index}")
-                print(f"  Audio End [ms]: {message.audio_end_ms}")
-            case "conversation.item.deleted":
-                print("Conversation Item Deleted Message")
-                print(f"  Id: {message.item_id}")
-            case "conversation.item.input_audio_transcription.completed":
-                print("Input Audio Transcription Completed Message")
-                print(f"  Id: {message.item_id}")
-                print(f"  Content Index: {message.content_index}")
-                print(f"  Transcript: {message.transcript}")
-            case "conversation.item.input_audio_transcription.failed":
-                print("Input Audio Transcription Failed Message")
-                print(f"  Id: {message.item_id}")
-                print(f"  Error: {message.error}")
-            case "response.created":
-                print("Response Created Message")
-                print(f"  Response Id: {message.response.id}")
-                print("  Output Items:")
-                for index, item in enumerate(message.response.output):
-                    print(f"  [{index}]:")
-                    print(f"    Item Id: {item.id}")
-                    print(f"    Type: {item.type}")
-                    if item.type == "message":
-                        print(f"    Role: {item.role}")
-                        match item.role:
-                            case "system":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    print(f"      Text: {content.text}")
-                            case "user":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    if content.type == "input_text":
-                                        print(f"      Text: {content.text}")
-                                    elif content.type == "input_audio":
-                                        print(f"      Audio Data Length: {len(content.audio)}")
-                            case "assistant":
-                                for content_index, content in enumerate(item.content):
-                                    print(f"    [{content_index}]:")
-                                    print(f"      Content Type: {content.type}")
-                                    print(f"      Text: {content.text}")
-                    elif item.type == "function_call":
-                        print(f"    Call Id: {item.call_id}")
-                        print(f"    Function Name: {item.name}")
-                        print(f"    Parameters: {item.arguments}")
-                    elif item.type == "function_call_output":
-                        print(f"    Call Id: {item.call_id}")
-                        print(f"    Output: {item.output}")
-            case "response.done":
-                print("Response Done Message")
-                print(f"  Response Id: {message.response.id}")
-                if message.response.status_details:
-                    print(f"  Status Details: {message.response.status_details.model_dump_json()}")
-                # break
-            case "response.output_item.added":
-                print("Response Output Item Added Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item.id}")
-            case "response.output_item.done":
-                print("Response Output Item Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item.id}")
-
-            case "response.content_part.added":
-                print("Response Content Part Added Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-            case "response.content_part.done":
-                print("Response Content Part Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  ItemPart Id: {message.item_id}")
-            case "response.text.delta":
-                print("Response Text Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Text: {message.delta}")
-            case "response.text.done":
-                print("Response Text Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Text: {message.text}")
-            case "response.audio_transcript.delta":
-                print("Response Audio Transcript Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Transcript: {message.delta}")
-            case "response.audio_transcript.done":
-                print("Response Audio Transcript Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Transcript: {message.transcript}")
-            case "response.audio.delta":
-                print("Response Audio Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                print(f"  Audio Data Length: {len(message.delta)}")
-                audio_buffer += base64.b64decode(message.delta)
-
-            case "response.audio.done":
-                print("Response Audio Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Item Id: {message.item_id}")
-                # Play the complete audio buffer
-                play_audio(audio_buffer)
-                audio_buffer = b''  # Reset the buffer
-                
-            case "response.function_call_arguments.delta":
-                print("Response Function Call Arguments Delta Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Arguments: {message.delta}")
-            case "response.function_call_arguments.done":
-                print("Response Function Call Arguments Done Message")
-                print(f"  Response Id: {message.response_id}")
-                print(f"  Arguments: {message.arguments}")
-            case "rate_limits.updated":
-                print("Rate Limits Updated Message")
-                print(f"  Rate Limits: {message.rate_limits}")
-            case _:
-                print("Unknown Message")
+    messages = asyncio.Queue()
+    await asyncio.gather(_receive_loop(client, messages), _process_messages(messages))
 
 
 def get_env_var(var_name: str) -> str:
@@ -240,12 +312,12 @@ def get_env_var(var_name: str) -> str:
     return value
 
 
-async def with_azure_openai(audio_queue: queue.Queue, stop_event: threading.Event):
+async def with_azure_openai(stop_event: threading.Event):
     endpoint = get_env_var("AZURE_OPENAI_ENDPOINT")
     key = get_env_var("AZURE_OPENAI_API_KEY")
     deployment = get_env_var("AZURE_OPENAI_DEPLOYMENT")
     async with RTLowLevelClient(
-        endpoint, key_credential=AzureKeyCredential(key), azure_deployment=deployment
+        endpoint, key_credential=AzureKeyCredential(key), azure_deployment=deployment, binary_frames=BINARY_AUDIO
     ) as client:
         # Send the session update message once
         await client.send(
@@ -257,21 +329,44 @@ async def with_azure_openai(audio_queue: queue.Queue, stop_event: threading.Even
             )
         )
 
-        # Start streaming audio and receiving messages concurrently
-        await asyncio.gather(stream_audio(client, audio_queue, stop_event), receive_messages(client))
-
+        # Bridge the recorder thread into this loop: captured chunks are
+        # posted straight onto an asyncio.Queue via call_soon_threadsafe,
+        # so the sender forwards them as soon as they exist instead of
+        # polling a thread queue every 100 ms.
+        loop = asyncio.get_running_loop()
+        audio_queue = asyncio.Queue()
+        threading.Thread(target=record_audio, args=(audio_queue, loop, stop_event), daemon=True).start()
 
-async def stream_audio(client: RTLowLevelClient, audio_queue: queue.Queue, stop_event: threading.Event):
-    while not stop_event.is_set():
-        try:
-            chunk = audio_queue.get_nowait()
-            base64_audio = base64.b64encode(chunk).decode("utf-8")
-            await client.send(InputAudioBufferAppendMessage(audio=base64_audio))
-        except queue.Empty:
-            await asyncio.sleep(0.1)  # Short sleep to prevent busy-waiting
-
-
-def record_audio(audio_queue: queue.Queue, stop_event: threading.Event):
+        # Start streaming audio and receiving messages concurrently
+        await asyncio.gather(stream_audio(client, audio_queue), receive_messages(client))
+
+
+async def stream_audio(client: RTLowLevelClient, audio_queue: asyncio.Queue):
+    # Coalesce several capture chunks per message: fewer websocket frames,
+    # and base64 runs over one larger contiguous buffer.
+    BATCH_BYTES = 8192
+
+    async def send_batch(batch: bytearray):
+        if BINARY_AUDIO:
+            await client.send_binary(bytes(batch))
+            return
+        base64_audio = (await asyncio.to_thread(base64.b64encode, bytes(batch))).decode("utf-8")
+        await client.send(InputAudioBufferAppendMessage(audio=base64_audio))
+
+    batch = bytearray()
+    while True:
+        chunk = await audio_queue.get()
+        if chunk is None:  # recording stopped
+            break
+        batch.extend(chunk)
+        if len(batch) >= BATCH_BYTES:
+            await send_batch(batch)
+            batch.clear()
+    if batch:
+        await send_batch(batch)
+
+
+def record_audio(audio_queue: asyncio.Queue, loop: asyncio.AbstractEventLoop, stop_event: threading.Event):
     CHUNK = 1024
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
@@ -279,20 +374,23 @@ def record_audio(audio_queue: queue.Queue, stop_event: threading.Event):
 
     p = pyaudio.PyAudio()
 
+    def on_chunk(in_data, frame_count, time_info, status):
+        # Called from PortAudio's capture thread; nothing happens here
+        # beyond handing the buffer to the event loop.
+        loop.call_soon_threadsafe(audio_queue.put_nowait, in_data)
+        return (None, pyaudio.paContinue)
+
     stream = p.open(format=FORMAT,
                     channels=CHANNELS,
                     rate=RATE,
                     input=True,
-                    frames_per_buffer=CHUNK)
+                    frames_per_buffer=CHUNK,
+                    stream_callback=on_chunk)
 
     print("Recording...")
-
-    while not stop_event.is_set():
-        data = stream.read(CHUNK)
-        print("Recoding In Progress")
-        audio_queue.put(data)
-
+    stop_event.wait()
     print("Recording stopped.")
+    loop.call_soon_threadsafe(audio_queue.put_nowait, None)  # wake the sender
 
     stream.stop_stream()
     stream.close()
@@ -305,26 +403,22 @@ def create_gui():
 
     recording = False
     stop_event = threading.Event()
-    audio_queue = queue.Queue()
-    processing_thread = None
+    session_task = None
 
     def toggle_recording():
-        nonlocal recording, processing_thread
+        nonlocal recording, session_task
         if not recording:
             recording = True
             button.config(text="Stop Recording")
             stop_event.clear()
-            # Start the recording thread
-            threading.Thread(target=record_audio, args=(audio_queue, stop_event), daemon=True).start()
-            # Start the processing thread
-            processing_thread = threading.Thread(target=run_azure_openai, args=(audio_queue, stop_event), daemon=True)
-            processing_thread.start()
+            # Tk callbacks fire inside root.update(), i.e. on the asyncio
+            # loop itself, so the session is just another task on it — no
+            # worker thread and no cross-thread handoff for UI events.
+            session_task = asyncio.get_running_loop().create_task(with_azure_openai(stop_event))
         else:
             recording = False
             button.config(text="Start Recording")
             stop_event.set()
-            if processing_thread:
-                processing_thread.join()
 
     button = tk.Button(root, text="Start Recording", command=toggle_recording)
     button.pack(pady=20)
@@ -332,18 +426,34 @@ def create_gui():
     def on_closing():
         if recording:
             stop_event.set()
-        root.quit()
+        if session_task is not None:
+            session_task.cancel()
+        root.destroy()
 
     root.protocol("WM_DELETE_WINDOW", on_closing)
-    return root, audio_queue
+    return root
 
 
-def run_azure_openai(audio_queue, stop_event):
-    asyncio.run(with_azure_openai(audio_queue, stop_event))
+async def tk_tick(root: tk.Tk):
+    # Pump Tk events from the asyncio loop instead of running mainloop()
+    # on its own thread; destroy() ends the loop via TclError.
+    try:
+        while True:
+            root.update()
+            await asyncio.sleep(1 / 60)
+    except tk.TclError:
+        pass
+
+
+async def main():
+    root = create_gui()
+    await tk_tick(root)
 
 
 if __name__ == "__main__":
     load_dotenv()
-    
-    root, audio_queue = create_gui()
-    root.mainloop()
\ No newline at end of file
+    # Default WARNING keeps the per-delta diagnostics free: log.debug then
+    # skips formatting entirely. Set RTCLIENT_LOGLEVEL=DEBUG to see them.
+    logging.basicConfig(level=os.environ.get("RTCLIENT_LOGLEVEL", "WARNING").upper())
+
+    asyncio.run(main())
\ No newline at end of file